@@ -19,6 +19,7 @@ from typing import (
 )
 
 from .relation import Relation
+from .selectable import _EMPTY
 
 if TYPE_CHECKING:
     from omen2 import Omen, Table, Relation
@@ -212,12 +213,16 @@ class M2MHelper(Relation[ROW_TYPE]):
 
         return M2MMixObj(res, obj)
 
-    def select(self, _where=None, **kws) -> Generator[ROW_TYPE, None, None]:
+    def select(  # pylint: disable=unused-argument
+        self, _where=None, _limit=None, **kws
+    ) -> Generator[ROW_TYPE, None, None]:
         """Select a member of the m2m list.
 
         Returns mixin objects that represents the relation.
+
+        The _limit hint is ignored, since related rows are filtered after selection.
         """
-        _where = {} if _where is None else _where
+        _where = _EMPTY if _where is None else _where
         kws2 = {}
         for k in kws.copy():
             if k not in self.table_type.field_names:
@@ -75,8 +75,13 @@ class ObjBase:
         except OmenNoPkError:
             return id(self)
 
+    @staticmethod
+    def _pk_key_from(items) -> tuple:
+        """Get the table cache key from (field, value) pairs of a primary key."""
+        return tuple(sorted(items))
+
     def _to_pk_tuple(self):
-        return tuple(sorted(self._to_pk().items()))
+        return self._pk_key_from(self._to_pk().items())
 
     def __lt__(self, other: "ObjBase"):
         return self._to_pk_tuple() < other._to_pk_tuple()
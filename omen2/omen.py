@@ -160,6 +160,7 @@ class Omen(abc.ABC):
             if args and issubclass(args[0], ObjBase):
                 tab.row_type = args[0]
                 tab.row_type._table_type = tab
+                tab._init_row_type()
 
     @classmethod
     def codegen(cls, only_if_missing=False, out_path=None):
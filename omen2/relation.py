@@ -5,7 +5,7 @@
 
 from typing import TypeVar, Callable, Generator, TYPE_CHECKING, List, Optional
 
-from .selectable import Selectable
+from .selectable import Selectable, _EMPTY
 
 if TYPE_CHECKING:
     from omen2 import ObjBase, Omen, Table
@@ -32,6 +32,7 @@ class Relation(Selectable[T]):
 
         self._from = _from
         self._where = where
+        self._set_pk(self.row_type._pk)
         self.__table: Optional["Table"] = None
         self.__saved: List["ObjBase"] = []
         if _init:
@@ -51,6 +52,7 @@ class Relation(Selectable[T]):
             mgr: "Omen" = self._from._table.manager
             self.__table: "Table" = mgr.get_table_by_name(self.table_type.table_name)
             self.table_type = type(self.__table)
+            self._set_pk(self.row_type._pk)
         return self.__table
 
     def add(self, obj: "ObjBase"):
@@ -79,7 +81,7 @@ class Relation(Selectable[T]):
         """
         self.table.remove(obj)
 
-    def select(self, _where=None, **kws) -> Generator[T, None, None]:
+    def select(self, _where=None, _limit=None, **kws) -> Generator[T, None, None]:
         """Works like select on the related table, except it is filtered by those matching my relation.
 
         Example using lambda, can be useful if 'driverid' is autogenerated:
@@ -88,13 +90,15 @@ class Relation(Selectable[T]):
                 self, where={"id": lambda: self.driverid}, cascade=False
             )
         """
-        _where = {} if _where is None else _where
+        _where = _EMPTY if _where is None else _where
         where = {**_where, **kws, **self._where}
         for k, v in where.items():
             if isinstance(v, Callable):
                 where[k] = v()
         if self.is_bound():
-            for obj in self.table.select(**where):
+            # saved objects may shadow db rows, so only limit when there are none
+            limit = None if self.__saved else _limit
+            for obj in self.table.select(_limit=limit, **where):
                 if obj not in self.__saved:
                     yield obj
         for obj in self.__saved:
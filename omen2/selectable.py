@@ -2,7 +2,19 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 """Generic selectable support for tables, relations and m2mhelpers."""
-from typing import TypeVar, Generic, Optional, Generator, TYPE_CHECKING, Type, Iterator
+from contextlib import closing
+from types import MappingProxyType
+from typing import (
+    TypeVar,
+    Generic,
+    Optional,
+    Generator,
+    TYPE_CHECKING,
+    Type,
+    Iterator,
+    Mapping,
+    Tuple,
+)
 
 from omen2.errors import OmenMoreThanOneError, OmenKeyError
 
@@ -12,6 +24,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ObjBase")
 
+_MISSING = object()
+
+# OmenKeyError message for __call__, shared by the generated versions
+_NOT_FOUND = "%s not in %s"
+
+# read-only where clause shared by unfiltered selects
+_EMPTY: Mapping = MappingProxyType({})
+
 
 # noinspection PyDefaultArgument
 class Selectable(Generic[T]):
@@ -20,75 +40,105 @@ class Selectable(Generic[T]):
     # pylint: disable=dangerous-default-value, protected-access
 
     row_type: Type[T]
+    # primary key info, set on the class by _init_row_type, or by _set_pk
+    _pk: Optional[Tuple[str, ...]] = None
+    _pk_single: Optional[str] = None
+
+    def __init_subclass__(cls, *_a, **_kws):
+        super().__init_subclass__(*_a, **_kws)
+        cls._init_row_type()
+
+    @classmethod
+    def _init_row_type(cls):
+        """Cache primary key info on the class, if its row type is known."""
+        row_type = getattr(cls, "row_type", None)
+        if isinstance(row_type, type):
+            pk = row_type._pk
+            cls._pk = pk
+            cls._pk_single = pk[0] if len(pk) == 1 else None
+            # don't replace a __call__ that a subclass wrote by hand
+            if cls.__call__ is Selectable.__call__ or hasattr(cls.__call__, "pk_call"):
+                cls.__call__ = (
+                    _call_single_pk(pk[0]) if len(pk) == 1 else _call_multi_pk
+                )
+
+    def _set_pk(self, pk: Tuple[str, ...]):
+        """Cache primary key info, for selectables whose row type is only known at runtime."""
+        self._pk = pk
+        self._pk_single = pk[0] if len(pk) == 1 else None
 
     # noinspection PyProtectedMember
     def get(self, _id=None, _default=None, **kws) -> Optional[T]:
         """Shortcut method, you can access object by a single pk/positional id."""
         if _id is not None:
-            assert not kws and len(self.row_type._pk) == 1
+            assert not kws and self._pk_single is not None
             return self._get_by_id(_id) or _default
         return self.select_one(**kws) or _default
 
     def _get_by_id(self, _id):
-        assert len(self.row_type._pk) == 1
-        kws = {self.row_type._pk[0]: _id}
-        return self.select_one(**kws)
+        pk = self._pk_single
+        assert pk is not None
+        with closing(self.select(_limit=1, **{pk: _id})) as itr:
+            return next(itr, None)
 
     def __contains__(self, item) -> bool:
         # noinspection PyTypeChecker
         if isinstance(item, self.row_type):
             # noinspection PyProtectedMember
-            return self.select_one(_where=item._to_pk()) is not None
+            with closing(self.select(item._to_pk(), _limit=1)) as itr:
+                return next(itr, None) is not None
         return self._get_by_id(item) is not None
 
     def __call__(self, _id=None, **kws) -> T:
         if _id is not None:
-            # noinspection PyProtectedMember
-            assert len(self.row_type._pk) == 1
-            # noinspection PyProtectedMember
-            kws[self.row_type._pk[0]] = _id
+            pk = self._pk_single
+            assert pk is not None
+            kws[pk] = _id
         if (ret := self.select_one(**kws)) is None:
-            raise OmenKeyError("%s not in %s" % (kws, self.__class__.__name__))
+            raise OmenKeyError(_NOT_FOUND % (kws, self.__class__.__name__))
         return ret
 
     def select_one(self, _where=None, **kws) -> Optional[T]:
         """Return one row, None, or raises an OmenMoreThanOneError."""
-        _where = {} if _where is None else _where
-        itr = self.select(_where, **kws)
+        _where = _EMPTY if _where is None else _where
+        itr = self.select(_where, _limit=2, **kws)
         return self._return_one(itr)
 
     def select_any_one(self, _where=None, **kws) -> Optional[T]:
         """Return one row or None, doesn't raise an error if there is more than one."""
-        _where = {} if _where is None else _where
-        itr = self.select(_where, **kws)
+        _where = _EMPTY if _where is None else _where
+        itr = self.select(_where, _limit=1, **kws)
         return self._return_any_one(itr)
 
     @staticmethod
     def _return_any_one(itr: Generator[T, None, None]) -> Optional[T]:
-        try:
-            return next(itr)
-        except StopIteration:
-            return None
-
-    @classmethod
-    def _return_one(cls, itr: Generator[T, None, None]) -> Optional[T]:
-        one = cls._return_any_one(itr)
+        return next(itr, None)
 
-        try:
-            next(itr)
+    @staticmethod
+    def _return_one(itr: Generator[T, None, None]) -> Optional[T]:
+        one = next(itr, _MISSING)
+        if one is _MISSING:
+            return None
+        if next(itr, _MISSING) is not _MISSING:
+            # release the db cursor now, rather than when the generator is collected
             itr.close()
             raise OmenMoreThanOneError
-        except StopIteration:
-            return one
+        return one
 
-    def select(self, _where=None, **kws) -> Generator[T, None, None]:
-        """Read objects of specified class."""
-        _where = {} if _where is None else _where
+    def select(self, _where=None, _limit=None, **kws) -> Generator[T, None, None]:
+        """Read objects of specified class.
+
+        _limit is a hint: implementations may stop after that many rows, but are not required to.
+        """
+        _where = _EMPTY if _where is None else _where
         raise NotImplementedError
 
     def count(self, _where=None, **kws) -> int:
-        """Return count of objs matchig where clause.  Override for efficiency."""
-        _where = {} if _where is None else _where
+        """Return count of objs matchig where clause.
+
+        This walks every matching row, subclasses that override select() should override this too.
+        """
+        _where = _EMPTY if _where is None else _where
         return sum(1 for _ in self.select(_where, **kws))
 
     def __len__(self):
@@ -98,3 +148,28 @@ class Selectable(Generic[T]):
     def __iter__(self) -> Iterator[T]:
         """Shortcut for self.select()"""
         return self.select()
+
+
+def _call_single_pk(pk: str):
+    """Make a Selectable.__call__ for a row type with a single primary key."""
+
+    def __call__(self, _id=None, **kws):
+        if _id is not None:
+            kws[pk] = _id
+        if (ret := self.select_one(**kws)) is None:
+            raise OmenKeyError(_NOT_FOUND % (kws, self.__class__.__name__))
+        return ret
+
+    __call__.pk_call = True
+    return __call__
+
+
+def _call_multi_pk(self, _id=None, **kws):
+    """Selectable.__call__ for a row type with a compound primary key."""
+    assert _id is None, "positional id requires a single primary key"
+    if (ret := self.select_one(**kws)) is None:
+        raise OmenKeyError(_NOT_FOUND % (kws, self.__class__.__name__))
+    return ret
+
+
+_call_multi_pk.pk_call = True
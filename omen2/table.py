@@ -7,12 +7,13 @@ import threading
 import weakref
 from contextlib import suppress
 from enum import Enum
+from operator import attrgetter
 from typing import Set, Dict, Iterable, TYPE_CHECKING, TypeVar, Tuple, Generator
 
 from .errors import OmenNoPkError, OmenRollbackError, IntegrityError
 import logging as log
 
-from .selectable import Selectable
+from .selectable import Selectable, _EMPTY
 from .object import ObjBase
 
 if TYPE_CHECKING:
@@ -47,6 +48,7 @@ class Table(Selectable[T]):
     allow_auto: bool = None
 
     def __init_subclass__(cls, *_a, **_kws):
+        super().__init_subclass__(*_a, **_kws)
         if hasattr(cls, "row_type"):
             cls.row_type._table_type = cls
 
@@ -230,9 +232,16 @@ class Table(Selectable[T]):
         """Call select on the underlying db, given a where dict of keys/values."""
         return self.db.select(self.table_name, None, where)
 
-    def db_select_gen(self, where, order_by=None):
+    def db_select_gen(self, where, order_by=None, limit=None):
         """Call select_gen on the underlying db, given a where dict of keys/values."""
-        yield from self.db.select_gen(self.table_name, None, where, order_by=order_by)
+        if limit is None:
+            yield from self.db.select_gen(
+                self.table_name, None, where, order_by=order_by
+            )
+        else:
+            yield from self.db.select_gen(
+                self.table_name, None, where, order_by=order_by, _limit=limit
+            )
 
     def __select_intx(self, where) -> Generator[T, None, None]:
         if self._in_tx():
@@ -243,13 +252,32 @@ class Table(Selectable[T]):
                 if obj._matches(where):
                     yield obj
 
-    def __select(self, where, _order_by=None) -> Generator[T, None, None]:
+    def __get_cached_row(self, key, dct) -> "ObjBase":
+        """Return the cached object for a db row, if the row doesn't change it.
+
+        Saves constructing a throwaway object for every row that is already cached.
+        """
+        with self.lock:
+            cached: "ObjBase" = self._cache.get(key)
+            if cached and (cached._is_locked() or cached._to_db() == dct):
+                return cached
+        return None
+
+    def __select(self, where, _order_by=None, _limit=None) -> Generator[T, None, None]:
         db_pks = set()
         db_where = {k: v for k, v in where.items() if k in self.field_names}
         attr_where = {k: v for k, v in where.items() if k not in self.field_names}
-        for row in self.db_select_gen(db_where, order_by=_order_by):
-            obj = self.row_type._from_db_not_new(row._asdict())
-            pk = obj._to_pk_tuple()
+        if attr_where or self._in_tx():
+            # rows may be filtered after the db query, so the db can't limit them
+            _limit = None
+        for row in self.db_select_gen(db_where, order_by=_order_by, limit=_limit):
+            dct = row._asdict()
+            # key by the db row: a locked object may hold an uncommitted pk
+            pk = ObjBase._pk_key_from((k, dct[k]) for k in self._pk)
+            obj = self.__get_cached_row(pk, dct)
+            if obj is None:
+                obj = self.row_type._from_db_not_new(dct)
+                pk = obj._to_pk_tuple()
             db_pks.add(pk)
             if self._in_tx():
                 tid = threading.get_ident()
@@ -259,7 +287,11 @@ class Table(Selectable[T]):
             with self.lock:
                 cached: "ObjBase" = self._cache.get(pk)
                 if cached:
-                    if not cached._is_locked() and obj._to_db() != cached._to_db():
+                    if (
+                        cached is not obj
+                        and not cached._is_locked()
+                        and obj._to_db() != cached._to_db()
+                    ):
                         log.debug("updating %r from db", obj)
                         cached._update_from_object(obj)
                     obj = cached
@@ -271,7 +303,9 @@ class Table(Selectable[T]):
 
         yield from self.__select_intx(where)
 
-        self.__clean_cache(where, db_pks)
+        if _limit is None or len(db_pks) < _limit:
+            # only a complete result set can tell us what's missing from the db
+            self.__clean_cache(where, db_pks)
 
     def __clean_cache(self, where, db_pks):
         # remove cached items that are no longer in the db
@@ -283,18 +317,21 @@ class Table(Selectable[T]):
             log.debug("removing %s from cache", pop_me)
             self._cache.pop(pop_me, None)  # Don't raise if not in cache
 
-    def select(self, _where=None, _order_by=None, **kws) -> Generator[T, None, None]:
+    def select(
+        self, _where=None, _order_by=None, _limit=None, **kws
+    ) -> Generator[T, None, None]:
         """Read objects of specified class.
 
         Specify _order_by="field" or ["field1 desc", "field2"] to sort the results.
+        Specify _limit=N to stop reading from the db after N rows.
         """
-        _where = {} if _where is None else _where
+        _where = _EMPTY if _where is None else _where
         kws.update(_where)
-        yield from self.__select(kws, _order_by=_order_by)
+        yield from self.__select(kws, _order_by=_order_by, _limit=_limit)
 
     def count(self, _where=None, **kws) -> int:
         """Return count of objs matching where clause."""
-        _where = {} if _where is None else _where
+        _where = _EMPTY if _where is None else _where
         kws.update(_where)
         return self.db.count(self.table_name, kws)
 
@@ -373,17 +410,65 @@ class ObjCache(Selectable[T]):
         self.table = table
         self.table._cache = {}  # change the weak dict to a permanent dict
 
+        row_type = table.row_type
+        self._set_pk(row_type._pk)
+        # serialized pk values may not match attributes or where clauses
+        self._pk_plain = row_type._to_pk is ObjBase._to_pk
+        self._pk_names = frozenset(row_type._pk)
+        # getter order for pk values, keys are built by ObjBase._pk_key_from
+        self._pk_sorted = tuple(sorted(row_type._pk))
+        self._pk_getter = attrgetter(*self._pk_sorted)
+
     def __getattr__(self, item):
         """Pass though to table on everything but select."""
         return getattr(self.table, item)
 
-    def select(self, _where=None, **kws) -> Generator[T, None, None]:
+    def __contains__(self, item) -> bool:
+        if self._pk_plain and isinstance(item, self.row_type):
+            got = self._pk_getter(item)
+            vals = (got,) if len(self._pk_sorted) == 1 else got
+            key = ObjBase._pk_key_from(zip(self._pk_sorted, vals))
+            cached = self.table._cache.get(key)
+            # stale keys are left behind when a pk is edited, so check the hit
+            if cached is not None and (
+                cached is item or self._pk_getter(cached) == got
+            ):
+                return True
+        return super().__contains__(item)
+
+    def _pk_key(self, where):
+        """Return the cache key for a where clause on exactly the primary key, or None."""
+        if not self._pk_plain or where.keys() != self._pk_names:
+            return None
+        key = ObjBase._pk_key_from(where.items())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def select(self, _where=None, _limit=None, **kws) -> Generator[T, None, None]:
         """Read objects from the cache."""
-        _where = {} if _where is None else _where
+        _where = _EMPTY if _where is None else _where
         kws.update(_where)
+        if (key := self._pk_key(kws)) is not None:
+            obj = self.table._cache.get(key)
+            if obj is not None and obj._matches(kws):
+                yield obj
+            return
+        found = 0
         for v in self.table._cache.values():
             if v._matches(kws):
                 yield v
+                found += 1
+                if found == _limit:
+                    return
+
+    def count(self, _where=None, **kws) -> int:
+        """Return count of cached objs matching where clause."""
+        if not _where and not kws:
+            return len(self.table._cache)
+        return super().count(_where, **kws)
 
     def reload(self):
         """Reload the objects in the cache from the db."""
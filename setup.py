@@ -22,7 +22,7 @@ setup(
     long_description_content_type="text/markdown",
     setup_requires=["wheel"],
     install_requires=[
-        "notanorm>=3",
+        "notanorm>=3.3",
         "sqlglot>=9",
     ],
     entry_points={"console_scripts": ["omen2-codegen=omen2.codegen:main"]},
@@ -592,6 +592,15 @@ def test_cache():
     assert not cars.select_one(id=98)
 
     assert cars.reload() == 4
+    with patch.object(
+        ObjCache, "select", autospec=True, side_effect=ObjCache.select
+    ) as select:
+        # unfiltered counts come from the cache size, without a scan
+        assert len(cars) == 4
+        assert cars.count() == 4
+        assert not select.called
+        assert cars.count(gas_level=98) == 1
+        assert select.called
 
     log.debug(orig._cache)
 
@@ -599,6 +608,76 @@ def test_cache():
     assert cars.select_one(id=98)
 
 
+def test_cache_pk_lookup():
+    db = SqliteDb(":memory:")
+    mgr = MyOmen(db)
+    mgr.car_drivers = ObjCache(CarDrivers(mgr))
+    mgr.car_drivers.add(CarDriver(carid=1, driverid=2))
+    mgr.car_drivers.add(CarDriver(carid=1, driverid=3))
+
+    orig_matches = CarDriver._matches
+    with patch.object(
+        CarDriver, "_matches", autospec=True, side_effect=orig_matches
+    ) as matches:
+        assert mgr.car_drivers.select_one(driverid=2, carid=1).driverid == 2
+        assert not mgr.car_drivers.select_one(carid=2, driverid=2)
+        # pk lookups don't scan the cache
+        assert matches.call_count == 1
+
+    assert len(list(mgr.car_drivers.select(carid=1))) == 2
+
+    # unhashable values fall back to a scan
+    assert not mgr.car_drivers.select_one(carid=1, driverid=[2])
+
+    with patch.object(
+        CarDriver, "_to_pk", autospec=True, side_effect=CarDriver._to_pk
+    ) as to_pk:
+        assert CarDriver(carid=1, driverid=3) in mgr.car_drivers
+        assert not to_pk.called
+    assert CarDriver(carid=2, driverid=3) not in mgr.car_drivers
+
+    assert mgr.car_drivers(carid=1, driverid=3).driverid == 3
+    with pytest.raises(OmenKeyError):
+        mgr.car_drivers(carid=1, driverid=4)
+    with pytest.raises(AssertionError):
+        mgr.car_drivers.table(1)
+
+
+def test_select_reuses_cached_rows():
+    db = SqliteDb(":memory:")
+    mgr = MyOmen(db)
+    mgr.cars = Cars(mgr)
+    cars = [mgr.cars.add(Car(id=i, gas_level=i, color="green")) for i in range(5)]
+
+    with patch.object(Car, "_from_db_not_new", wraps=Car._from_db_not_new) as from_db:
+        assert list(mgr.cars.select()) == cars
+        assert from_db.call_count == 0
+
+        # changed rows are still loaded and update the cached object
+        db.update("cars", id=3, color="red")
+        assert mgr.cars.select_one(color="red") is cars[3]
+        assert cars[3].color == "red"
+        assert from_db.call_count == 1
+
+
+def test_select_locked_pk_edit_rollback():
+    db = SqliteDb(":memory:")
+    mgr = MyOmen(db)
+    mgr.cars = Cars(mgr)
+    car = mgr.cars.add(Car(id=1, gas_level=1, color="green"))
+
+    with suppress(ValueError):
+        with car:
+            car.id = 99
+            assert list(mgr.cars.select()) == [car]
+            raise ValueError
+
+    # the cache is still keyed by the pk in the db
+    assert car.id == 1
+    assert list(mgr.cars._cache) == [(("id", 1),)]
+    assert mgr.cars.get(1) is car
+
+
 def test_iter_and_sort():
     db = SqliteDb(":memory:")
     mgr = MyOmen(db, cars=Cars)
@@ -1108,6 +1187,9 @@ def test_other_attrs():
     mgr.basic.new(id=1, data="someval")
     bas = mgr.basic.select_one(id=1)
     assert bas.custom_thing == 44
+    # pk info is cached once the row type is bootstrapped
+    assert Basics._pk_single == "id"
+    assert mgr.basic.get(1) is bas
     with pytest.raises(OmenUseWithError):
         bas.custom_thing = 3
 
@@ -1430,6 +1512,72 @@ def test_omen_fetch_close_select_one():
         check_mock.assert_called()
 
 
+def test_omen_fetch_close_get():
+    db = SqliteDb(":memory:")
+    mgr = MyOmen(db)
+    mgr.cars = Cars(mgr)
+
+    db.insert("cars", id=12, gas_level=0, color="green")
+
+    orig_exec = mgr.db.execute
+    closes = []
+
+    def new_exec(*a, **k):
+        ret = orig_exec(*a, **k)
+        closes.append(MagicMock(side_effect=ret.close))
+        return MagicMock(wraps=ret, close=closes[-1])
+
+    orig_select = mgr.cars.select
+    # holds references to the generators, so they won't GeneratorExit on __del__
+    ref_holder = []
+
+    def new_select(*a, **k):
+        ref_holder.append(orig_select(*a, **k))
+        return ref_holder[-1]
+
+    with patch.object(mgr.db, "execute", new_exec):
+        with patch.object(mgr.cars, "select", new_select):
+            assert mgr.cars.get(12)
+            assert Car(id=12) in mgr.cars
+
+    assert len(closes) == 2
+    for close in closes:
+        close.assert_called()
+
+
+def test_select_one_limits_db_rows():
+    db = SqliteDb(":memory:")
+    mgr = MyOmen(db)
+    mgr.cars = Cars(mgr)
+
+    for i in range(10):
+        db.insert("cars", id=i, gas_level=0, color="green")
+
+    sqls = []
+    orig_exec = mgr.db.execute
+
+    def new_exec(sql, *a, **k):
+        sqls.append(sql.lower())
+        return orig_exec(sql, *a, **k)
+
+    with patch.object(mgr.db, "execute", new_exec):
+        with pytest.raises(OmenMoreThanOneError):
+            mgr.cars.select_one(color="green")
+        assert "limit 2" in sqls[-1]
+
+        assert mgr.cars.get(4).id == 4
+        assert "limit 1" in sqls[-1]
+
+        assert mgr.cars.select_any_one(color="green")
+        assert Car(id=5) in mgr.cars
+        assert 11 not in mgr.cars
+
+    # limited selects don't evict cached rows they didn't read
+    car = mgr.cars.get(9)
+    assert len(list(mgr.cars.select(color="green", _limit=2))) == 2
+    assert mgr.cars._cache[car._to_pk_tuple()] is car
+
+
 def test_explicit_upsert():
     db = SqliteDb(":memory:")
     mgr = MyOmen(db)